@@ -0,0 +1,199 @@
+"""Implementation of the ``create`` command."""
+
+import os
+import stat
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import typer
+from rich.panel import Panel
+
+from ..config import ProjectConfig
+from ..project_generator import ProjectGenerator
+from . import get_console
+
+
+def run(
+    project_name: str,
+    path: Path | None,
+    python_version: str,
+    description: str | None,
+    author: str | None,
+    email: str | None,
+    interactive: bool,
+    show_progress: bool,
+) -> None:
+    """Create a new Python project with modern tooling setup."""
+    console = get_console()
+    try:
+        # Determine project path
+        if path is None:
+            path = Path.cwd()
+
+        project_path = path / project_name
+        display_path = str(project_path.absolute())
+
+        # Create configuration
+        config = ProjectConfig(
+            name=project_name,
+            python_version=python_version,
+            description=description or f"A Python project called {project_name}",
+            author=author,
+            email=email,
+        )
+
+        # Interactive mode for missing information
+        if interactive:
+            config = _gather_project_info(config)
+
+        # Show project summary
+        _show_project_summary(config, display_path)
+
+        if interactive and not _confirm("Proceed with project creation?"):
+            console.print("Operation cancelled.", style="yellow")
+            raise typer.Exit(1)
+
+        # Create the project directory, asking before reusing an existing one
+        try:
+            project_path.mkdir(parents=True)
+        except FileExistsError:
+            # One stat tells an existing project directory apart from a file
+            if not stat.S_ISDIR(os.stat(project_path).st_mode):
+                raise FileExistsError(
+                    f"'{display_path}' already exists and is not a directory"
+                ) from None
+            if not _confirm(f"Project '{project_name}' already exists. Overwrite?"):
+                console.print("Operation cancelled.", style="yellow")
+                raise typer.Exit(1) from None
+
+        # Create the project
+        generator = ProjectGenerator(config)
+
+        if show_progress and console.is_terminal:
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+            ) as progress:
+                progress.add_task("Creating project...", total=None)
+                generator.create_project(project_path)
+        else:
+            generator.create_project(project_path)
+
+        # Show success message
+        _show_success_message(display_path, config)
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"Error: {e}", style="red")
+        raise typer.Exit(1) from e
+
+
+def _confirm(message: str) -> bool:
+    """Ask a yes/no question, using rich prompts only on a terminal."""
+    if sys.stdout.isatty():
+        from rich.prompt import Confirm
+
+        return Confirm.ask(message)
+
+    try:
+        answer = input(f"{message} [y/N] ")
+    except EOFError:
+        return False
+    return answer.strip().lower() in ("y", "yes")
+
+
+def _prompt(message: str, default: str) -> str:
+    """Ask for a value, using rich prompts only on a terminal."""
+    if sys.stdout.isatty():
+        from rich.prompt import Prompt
+
+        return Prompt.ask(message, default=default)
+
+    try:
+        answer = input(f"{message} ({default}): ")
+    except EOFError:
+        return default
+    return answer.strip() or default
+
+
+def _gather_project_info(config: ProjectConfig) -> ProjectConfig:
+    """Gather missing project information interactively."""
+    changes: dict[str, str] = {}
+
+    if not config.author:
+        changes["author"] = _prompt("Author name", default="Your Name")
+
+    if not config.email:
+        changes["email"] = _prompt("Author email", default="your.email@example.com")
+
+    if (
+        not config.description
+        or config.description == f"A Python project called {config.name}"
+    ):
+        changes["description"] = _prompt(
+            "Project description", default=f"A Python project called {config.name}"
+        )
+
+    return replace(config, **changes) if changes else config
+
+
+def _show_project_summary(config: ProjectConfig, display_path: str) -> None:
+    """Show a summary of the project to be created."""
+    summary = f"""
+    [bold blue]Project Summary[/bold blue]
+    
+    Name: [cyan]{config.name}[/cyan]
+    Path: [cyan]{display_path}[/cyan]
+    Python: [cyan]{config.python_version}[/cyan]
+    Description: [cyan]{config.description}[/cyan]
+    Author: [cyan]{config.author}[/cyan]
+    Email: [cyan]{config.email}[/cyan]
+    
+    [bold green]Tools to be installed:[/bold green]
+    • uv (dependency management)
+    • pyright (static analysis)
+    • ruff (linting & formatting)
+    • beartype (runtime type checking)
+    • pytest (testing)
+    • pre-commit (git hooks)
+    • GitHub Actions (CI/CD)
+    """
+
+    get_console().print(
+        Panel(summary, title="📋 Project Summary", border_style="green")
+    )
+
+
+def _show_success_message(display_path: str, config: ProjectConfig) -> None:
+    """Show success message with next steps."""
+    next_steps = f"""
+    [bold green]✅ Project created successfully![/bold green]
+    
+    [bold]Next steps:[/bold]
+    
+    1. Navigate to your project:
+       [cyan]cd {display_path}[/cyan]
+    
+    2. Initialize git repository:
+       [cyan]git init[/cyan]
+    
+    3. Install dependencies:
+       [cyan]uv sync[/cyan]
+    
+    4. Activate virtual environment:
+       [cyan]uv shell[/cyan]
+    
+    5. Run tests:
+       [cyan]pytest[/cyan]
+    
+    6. Start coding in [cyan]src/{config.name}/[/cyan]
+    
+    [bold]Happy coding! 🚀[/bold]
+    """
+
+    get_console().print(Panel(next_steps, title="🎉 Success!", border_style="green"))
@@ -0,0 +1,27 @@
+"""Implementation of the ``info`` command."""
+
+from rich.panel import Panel
+
+from . import get_console
+
+
+def run() -> None:
+    """Show information about the CLI tool."""
+    info_text = """
+    [bold blue]PyBake CLI[/bold blue]
+    
+    Version: 0.1.0
+    
+    This tool creates new Python projects with:
+    • [green]uv[/green] for dependency management
+    • [green]pyright[/green] for static analysis
+    • [green]ruff[/green] for linting and formatting
+    • [green]beartype[/green] for runtime type checking
+    • [green]pytest[/green] for testing
+    • [green]pre-commit[/green] for git hooks
+    • [green]GitHub Actions[/green] for CI/CD
+    
+    Use [cyan]pybake create <name>[/cyan] to start a new project.
+    """
+
+    get_console().print(Panel(info_text, title="ℹ️  Information", border_style="blue"))
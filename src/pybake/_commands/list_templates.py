@@ -0,0 +1,31 @@
+"""Implementation of the ``list-templates`` command."""
+
+import sys
+
+from ..templates import get_project_templates
+from . import get_console
+
+
+def run() -> None:
+    """List available project templates."""
+    templates = get_project_templates()
+
+    if not sys.stdout.isatty():
+        print("Available project templates:")
+        for name, template in templates.items():
+            print(f"  {name:<10}  {template['description']}")
+        return
+
+    from rich.table import Table
+
+    console = get_console()
+    console.print("Available project templates:", style="bold blue")
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Template", style="cyan")
+    table.add_column("Description")
+
+    for name, template in templates.items():
+        table.add_row(name, template["description"])
+
+    console.print(table)
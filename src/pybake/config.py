@@ -1,9 +1,13 @@
 """Project configuration data classes."""
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 
+# Separator runs (or the start of the name) followed by the character to capitalize
+_PASCAL_RE = re.compile(r"(?:[-_\s]+|^)(.?)")
 
-@dataclass
+
+@dataclass(frozen=True)
 class ProjectConfig:
     """Configuration for a new Python project."""
 
@@ -12,26 +16,41 @@ class ProjectConfig:
     description: str
     author: str | None = None
     email: str | None = None
+    _package_name: str = field(init=False, repr=False, compare=False)
+    _class_name: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Validate configuration after initialization."""
-        if not self.name:
-            raise ValueError("Project name cannot be empty")
-
-        if not self.python_version:
-            raise ValueError("Python version cannot be empty")
-
-        if not self.description:
-            raise ValueError("Project description cannot be empty")
+        """Validate configuration and derive names after initialization."""
+        missing = [
+            field_name
+            for field_name, value in (
+                ("name", self.name),
+                ("python_version", self.python_version),
+                ("description", self.description),
+            )
+            if not value
+        ]
+        if missing:
+            raise ValueError(f"Required fields cannot be empty: {', '.join(missing)}")
+
+        # The dataclass is frozen, so derived names are set via object.__setattr__
+        object.__setattr__(
+            self,
+            "_package_name",
+            self.name.replace("-", "_").replace(" ", "_").lower(),
+        )
+        object.__setattr__(
+            self,
+            "_class_name",
+            _PASCAL_RE.sub(lambda match: match.group(1).upper(), self.name.lower()),
+        )
 
     @property
     def package_name(self) -> str:
         """Get the package name (normalized for imports)."""
-        return self.name.replace("-", "_").replace(" ", "_").lower()
+        return self._package_name
 
     @property
     def class_name(self) -> str:
         """Get the class name (PascalCase)."""
-        return "".join(
-            word.capitalize() for word in self.name.replace("-", " ").split()
-        )
+        return self._class_name
@@ -1,108 +1,21 @@
 """Project generation logic."""
 
+import os
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .config import ProjectConfig
 from .templates import get_project_templates
 
-
-class ProjectGenerator:
-    """Generates new Python projects with all required files and configurations."""
-
-    def __init__(self, config: ProjectConfig) -> None:
-        """Initialize the project generator."""
-        self.config = config
-        self.templates = get_project_templates()
-
-    def create_project(self, project_path: Path) -> None:
-        """Create a complete Python project at the specified path."""
-        # Create project directory
-        project_path.mkdir(parents=True, exist_ok=True)
-
-        # Create project structure
-        self._create_directory_structure(project_path)
-
-        # Generate all project files
-        self._generate_project_files(project_path)
-
-        # Make scripts executable (Unix-like systems)
-        self._make_scripts_executable(project_path)
-
-    def _create_directory_structure(self, project_path: Path) -> None:
-        """Create the project directory structure."""
-        directories = [
-            "src",
-            f"src/{self.config.package_name}",
-            "tests",
-            ".github",
-            ".github/workflows",
-        ]
-
-        for directory in directories:
-            (project_path / directory).mkdir(parents=True, exist_ok=True)
-
-    def _generate_project_files(self, project_path: Path) -> None:
-        """Generate all project files from templates."""
-        # Generate main project files
-        self._generate_file(
-            project_path, "pyproject.toml", self._get_pyproject_content()
-        )
-        self._generate_file(project_path, ".python-version", self.config.python_version)
-        self._generate_file(project_path, ".gitignore", self._get_gitignore_content())
-        self._generate_file(project_path, "README.md", self._get_readme_content())
-
-        # Tool configurations are now consolidated in pyproject.toml
-        self._generate_file(
-            project_path, ".pre-commit-config.yaml", self._get_precommit_content()
-        )
-
-        # Generate GitHub Actions
-        self._generate_file(
-            project_path / ".github" / "workflows",
-            "ci.yml",
-            self._get_github_actions_content(),
-        )
-
-        # Generate source code files
-        self._generate_file(
-            project_path / "src" / self.config.package_name,
-            "__init__.py",
-            self._get_init_content(),
-        )
-        self._generate_file(
-            project_path / "src" / self.config.package_name,
-            "main.py",
-            self._get_main_content(),
-        )
-
-        # Generate test files
-        self._generate_file(project_path / "tests", "__init__.py", "")
-        self._generate_file(
-            project_path / "tests",
-            f"test_{self.config.package_name}.py",
-            self._get_test_content(),
-        )
-
-    def _generate_file(self, path: Path, filename: str, content: str) -> None:
-        """Generate a file with the specified content."""
-        file_path = path / filename
-        file_path.write_text(content, encoding="utf-8")
-
-    def _make_scripts_executable(self, project_path: Path) -> None:
-        """Make shell scripts executable on Unix-like systems."""
-        # This is a no-op on Windows, but useful for cross-platform compatibility
-        pass
-
-    def _get_pyproject_content(self) -> str:
-        """Generate pyproject.toml content."""
-        return f'''[project]
-name = "{self.config.name}"
+_PYPROJECT_TEMPLATE = """[project]
+name = "{name}"
 version = "0.1.0"
-description = "{self.config.description}"
+description = "{description}"
 readme = "README.md"
-requires-python = ">={self.config.python_version}"
+requires-python = ">={python_version}"
 authors = [
-    {{name = "{self.config.author or "Your Name"}", email = "{self.config.email or "your.email@example.com"}"}}
+    {{name = "{author}", email = "{email}"}}
 ]
 dependencies = [
     "beartype>=0.16.0",
@@ -122,7 +35,7 @@ requires = ["hatchling"]
 build-backend = "hatchling.build"
 
 [tool.ruff]
-target-version = "py{self.config.python_version.replace(".", "")}"
+target-version = "py{py_tag}"
 line-length = 88
 lint.select = [
     "E",  # pycodestyle errors
@@ -151,7 +64,7 @@ exclude = [
 ]
 reportMissingImports = "warning"
 reportMissingTypeStubs = false
-pythonVersion = "{self.config.python_version}"
+pythonVersion = "{python_version}"
 
 [tool.pytest.ini_options]
 testpaths = ["tests"]
@@ -173,11 +86,9 @@ omit = [
     "*/tests/*",
     "*/test_*",
 ]
-'''
+"""
 
-    def _get_gitignore_content(self) -> str:
-        """Generate .gitignore content."""
-        return """# Byte-compiled / optimized / DLL files
+_GITIGNORE = """# Byte-compiled / optimized / DLL files
 __pycache__/
 *.py[cod]
 *$py.class
@@ -333,15 +244,13 @@ Desktop.ini
 uv.lock
 """
 
-    def _get_readme_content(self) -> str:
-        """Generate README.md content."""
-        return f"""# {self.config.name}
+_README_TEMPLATE = """# {name}
 
-{self.config.description}
+{description}
 
 ## Requirements
 
-- Python {self.config.python_version}+
+- Python {python_version}+
 - uv (recommended) or pip
 
 ## Installation
@@ -349,7 +258,7 @@ uv.lock
 1. Clone the repository:
    ```bash
    git clone <your-repo-url>
-   cd {self.config.name}
+   cd {name}
    ```
 
 2. Install dependencies:
@@ -389,14 +298,14 @@ pre-commit run --all-files
 ## Project Structure
 
 ```
-{self.config.name}/
+{name}/
 ├── src/
-│   └── {self.config.package_name}/
+│   └── {package_name}/
 │       ├── __init__.py
 │       └── main.py
 ├── tests/
 │   ├── __init__.py
-│   └── test_{self.config.package_name}.py
+│   └── test_{package_name}.py
 ├── .github/workflows/
 ├── pyproject.toml
 └── .pre-commit-config.yaml
@@ -416,12 +325,10 @@ This project is licensed under the MIT License - see the LICENSE file for detail
 
 ## Author
 
-{self.config.author or "Your Name"} - {self.config.email or "your.email@example.com"}
+{author} - {email}
 """
 
-    def _get_precommit_content(self) -> str:
-        """Generate .pre-commit-config.yaml content."""
-        return """repos:
+_PRECOMMIT = """repos:
   - repo: https://github.com/pre-commit/pre-commit-hooks
     rev: v4.5.0
     hooks:
@@ -445,9 +352,7 @@ This project is licensed under the MIT License - see the LICENSE file for detail
         additional_dependencies: [types-all]
 """
 
-    def _get_github_actions_content(self) -> str:
-        """Generate GitHub Actions CI workflow content."""
-        return f"""name: CI
+_GITHUB_CI_TEMPLATE = """name: CI
 
 on:
   push:
@@ -460,15 +365,15 @@ jobs:
     runs-on: ubuntu-latest
     strategy:
       matrix:
-        python-version: ["{self.config.python_version}"]
+        python-version: ["__PYVER__"]
 
     steps:
     - uses: actions/checkout@v4
     
-    - name: Set up Python ${{{{ matrix.python-version }}}}
+    - name: Set up Python ${{ matrix.python-version }}
       uses: actions/setup-python@v4
       with:
-        python-version: ${{{{ matrix.python-version }}}}
+        python-version: ${{ matrix.python-version }}
     
     - name: Install uv
       uses: astral-sh/setup-uv@v1
@@ -497,22 +402,18 @@ jobs:
         fail_ci_if_error: false
 """
 
-    def _get_init_content(self) -> str:
-        """Generate __init__.py content."""
-        return f'''"""Package {self.config.name}."""
+_INIT_TEMPLATE = '''"""Package {name}."""
 
 __version__ = "0.1.0"
-__author__ = "{self.config.author or "Your Name"}"
-__email__ = "{self.config.email or "your.email@example.com"}"
+__author__ = "{author}"
+__email__ = "{email}"
 
 from .main import main
 
 __all__ = ["main"]
 '''
 
-    def _get_main_content(self) -> str:
-        """Generate main.py content."""
-        return f'''"""Main module for {self.config.name}."""
+_MAIN_TEMPLATE = '''"""Main module for {name}."""
 
 from beartype import beartype
 
@@ -520,26 +421,24 @@ from beartype import beartype
 @beartype
 def main() -> None:
     """Main function."""
-    print("Hello from {self.config.name}!")
+    print("Hello from {name}!")
 
 
 if __name__ == "__main__":
     main()
 '''
 
-    def _get_test_content(self) -> str:
-        """Generate test file content."""
-        return f'''"""Tests for {self.config.name}."""
+_TEST_TEMPLATE = '''"""Tests for {name}."""
 
 import pytest
-from {self.config.package_name}.main import main
+from {package_name}.main import main
 
 
 def test_main(capsys):
     """Test main function output."""
     main()
     captured = capsys.readouterr()
-    assert "{self.config.name}" in captured.out
+    assert "{name}" in captured.out
 
 
 def test_main_returns_none():
@@ -547,3 +446,106 @@ def test_main_returns_none():
     result = main()
     assert result is None
 '''
+
+
+# Number of threads used to write project files concurrently
+_WRITE_WORKERS = 4
+
+
+class ProjectGenerator:
+    """Generates new Python projects with all required files and configurations."""
+
+    # Static files never depend on the config, so encode them once for all instances
+    _GITIGNORE_CONTENT = _GITIGNORE.encode("utf-8")
+    _PRECOMMIT_CONTENT = _PRECOMMIT.encode("utf-8")
+
+    def __init__(self, config: ProjectConfig) -> None:
+        """Initialize the project generator."""
+        self.config = config
+        self.templates = get_project_templates()
+        # Template fields, bound once so rendering does no config lookups
+        self._ctx = {
+            "name": config.name,
+            "package_name": config.package_name,
+            "class_name": config.class_name,
+            "python_version": config.python_version,
+            "py_tag": config.python_version.replace(".", ""),
+            "description": config.description,
+            "author": config.author or "Your Name",
+            "email": config.email or "your.email@example.com",
+        }
+
+    def create_project(self, project_path: Path) -> None:
+        """Create a complete Python project at the specified path."""
+        files = self._get_project_files()
+
+        # Create each required directory once (parents are created implicitly)
+        for directory in {posixpath.dirname(relative) for relative, _ in files}:
+            os.makedirs(project_path / directory, exist_ok=True)
+
+        # Generate all project files; they are independent, so overlap the writes
+        with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as executor:
+            # Consume the results so that any write error is raised here
+            list(
+                executor.map(
+                    self._generate_file,
+                    [project_path / relative for relative, _ in files],
+                    [content for _, content in files],
+                )
+            )
+
+    def _get_project_files(self) -> list[tuple[str, bytes]]:
+        """Get the relative path and encoded content of every project file."""
+        package_dir = f"src/{self._ctx['package_name']}"
+        return [
+            # Main project files
+            ("pyproject.toml", self._get_pyproject_content().encode("utf-8")),
+            (".python-version", self._ctx["python_version"].encode("utf-8")),
+            (".gitignore", self._GITIGNORE_CONTENT),
+            ("README.md", self._get_readme_content().encode("utf-8")),
+            # Tool configurations are now consolidated in pyproject.toml
+            (".pre-commit-config.yaml", self._PRECOMMIT_CONTENT),
+            # GitHub Actions
+            (
+                ".github/workflows/ci.yml",
+                self._get_github_actions_content().encode("utf-8"),
+            ),
+            # Source code files
+            (f"{package_dir}/__init__.py", self._get_init_content().encode("utf-8")),
+            (f"{package_dir}/main.py", self._get_main_content().encode("utf-8")),
+            # Test files
+            ("tests/__init__.py", b""),
+            (
+                f"tests/test_{self._ctx['package_name']}.py",
+                self._get_test_content().encode("utf-8"),
+            ),
+        ]
+
+    def _generate_file(self, file_path: Path, content: bytes) -> None:
+        """Generate a file with the specified (already encoded) content."""
+        file_path.write_bytes(content)
+
+    def _get_pyproject_content(self) -> str:
+        """Generate pyproject.toml content."""
+        return _PYPROJECT_TEMPLATE.format_map(self._ctx)
+
+    def _get_readme_content(self) -> str:
+        """Generate README.md content."""
+        return _README_TEMPLATE.format_map(self._ctx)
+
+    def _get_github_actions_content(self) -> str:
+        """Generate GitHub Actions CI workflow content."""
+        # Substituted with replace() so the ${{ }} expressions need no escaping
+        return _GITHUB_CI_TEMPLATE.replace("__PYVER__", self._ctx["python_version"])
+
+    def _get_init_content(self) -> str:
+        """Generate __init__.py content."""
+        return _INIT_TEMPLATE.format_map(self._ctx)
+
+    def _get_main_content(self) -> str:
+        """Generate main.py content."""
+        return _MAIN_TEMPLATE.format_map(self._ctx)
+
+    def _get_test_content(self) -> str:
+        """Generate test file content."""
+        return _TEST_TEMPLATE.format_map(self._ctx)
@@ -1,5 +1,8 @@
 """Tests for the PyBake CLI application."""
 
+import subprocess
+import sys
+
 import pytest
 from typer.testing import CliRunner
 
@@ -26,6 +29,7 @@ def test_list_templates_command(runner):
     assert "standard" in result.output
     assert "minimal" in result.output
     assert "web" in result.output
+    assert "Complete Python project with all modern tools" in result.output
 
 
 def test_create_command_help(runner):
@@ -39,3 +43,65 @@ def test_create_command_missing_name(runner):
     """Test the create command with missing project name."""
     result = runner.invoke(app, ["create"])
     assert result.exit_code != 0
+
+
+def test_cli_import_is_lazy():
+    """Test that importing the CLI does not load command implementations."""
+    code = (
+        "import sys, pybake.cli; "
+        "print(any(m.startswith(('rich.', 'pybake._commands', "
+        "'pybake.project_generator')) for m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_create_command_non_interactive(runner, tmp_path):
+    """Test creating a project without any prompts."""
+    result = runner.invoke(
+        app, ["create", "my-project", "--path", str(tmp_path), "--no-interactive"]
+    )
+    assert result.exit_code == 0
+    assert (tmp_path / "my-project" / "pyproject.toml").is_file()
+
+
+def test_create_command_prompts_without_terminal(runner, tmp_path):
+    """Test that prompts read plain input when not attached to a terminal."""
+    result = runner.invoke(
+        app,
+        ["create", "my-project", "--path", str(tmp_path)],
+        input="Jane Doe\n\nMy project\nn\n",
+    )
+    assert result.exit_code == 1
+    assert "Operation cancelled." in result.output
+    assert "Jane Doe" in result.output
+    assert not (tmp_path / "my-project").exists()
+
+
+def test_create_command_existing_project_cancelled(runner, tmp_path):
+    """Test that an existing project is left alone unless overwriting is confirmed."""
+    project_path = tmp_path / "my-project"
+    project_path.mkdir()
+
+    result = runner.invoke(
+        app,
+        ["create", "my-project", "--path", str(tmp_path), "--no-interactive"],
+        input="n\n",
+    )
+    assert result.exit_code == 1
+    assert "already exists" in result.output
+    assert "Error" not in result.output
+    assert not any(project_path.iterdir())
+
+
+def test_create_command_path_is_file(runner, tmp_path):
+    """Test that a file in the way of the project is reported as an error."""
+    (tmp_path / "my-project").write_text("", encoding="utf-8")
+
+    result = runner.invoke(
+        app, ["create", "my-project", "--path", str(tmp_path), "--no-interactive"]
+    )
+    assert result.exit_code == 1
+    assert "is not a directory" in result.output
@@ -0,0 +1,57 @@
+"""Tests for the PyBake project configuration."""
+
+import dataclasses
+
+import pytest
+
+from pybake.config import ProjectConfig
+
+
+def _config(name: str) -> ProjectConfig:
+    """Create a configuration with the given project name."""
+    return ProjectConfig(name=name, python_version="3.12", description="A project")
+
+
+@pytest.mark.parametrize(
+    ("name", "package_name"),
+    [
+        ("myproject", "myproject"),
+        ("my-project", "my_project"),
+        ("My Project", "my_project"),
+    ],
+)
+def test_package_name(name, package_name):
+    """Test package name normalization."""
+    assert _config(name).package_name == package_name
+
+
+@pytest.mark.parametrize(
+    ("name", "class_name"),
+    [
+        ("myproject", "Myproject"),
+        ("my-project", "MyProject"),
+        ("my project", "MyProject"),
+        ("my_project", "MyProject"),
+        ("My-HTTP-client-", "MyHttpClient"),
+    ],
+)
+def test_class_name(name, class_name):
+    """Test class name conversion to PascalCase."""
+    assert _config(name).class_name == class_name
+
+
+def test_empty_name_rejected():
+    """Test that an empty project name is rejected."""
+    with pytest.raises(ValueError, match="Required fields cannot be empty: name"):
+        _config("")
+
+
+def test_config_is_frozen():
+    """Test that configurations cannot be mutated after creation."""
+    config = _config("my-project")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.name = "other"  # type: ignore[misc]
+
+    updated = dataclasses.replace(config, name="other-project")
+    assert updated.package_name == "other_project"
+    assert config.package_name == "my_project"
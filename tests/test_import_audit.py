@@ -0,0 +1,27 @@
+"""Tests for the import-time audit tool."""
+
+import importlib.util
+from pathlib import Path
+
+_SPEC = importlib.util.spec_from_file_location(
+    "import_audit", Path(__file__).parent.parent / "tools" / "import_audit.py"
+)
+assert _SPEC is not None and _SPEC.loader is not None
+import_audit = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(import_audit)
+
+
+def test_parse_importtime():
+    """Test parsing importtime output into flat module rows."""
+    output = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |     rich.align",
+            "import time:      1500 |       4200 |   typer.main",
+            "Traceback (most recent call last):",
+        ]
+    )
+    assert import_audit.parse_importtime(output) == [
+        ("rich.align", 120, 120),
+        ("typer.main", 1500, 4200),
+    ]
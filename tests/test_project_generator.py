@@ -0,0 +1,67 @@
+"""Tests for the PyBake project generator."""
+
+import pytest
+
+from pybake.config import ProjectConfig
+from pybake.project_generator import ProjectGenerator
+
+
+@pytest.fixture
+def config():
+    """Create a project configuration for testing."""
+    return ProjectConfig(
+        name="my-project",
+        python_version="3.12",
+        description="A test project",
+        author="Jane Doe",
+        email="jane@example.com",
+    )
+
+
+def test_create_project_layout(config, tmp_path):
+    """Test that all project files are generated."""
+    project_path = tmp_path / "nested" / "my-project"
+    ProjectGenerator(config).create_project(project_path)
+
+    generated = sorted(
+        path.relative_to(project_path).as_posix()
+        for path in project_path.rglob("*")
+        if path.is_file()
+    )
+    assert generated == [
+        ".github/workflows/ci.yml",
+        ".gitignore",
+        ".pre-commit-config.yaml",
+        ".python-version",
+        "README.md",
+        "pyproject.toml",
+        "src/my_project/__init__.py",
+        "src/my_project/main.py",
+        "tests/__init__.py",
+        "tests/test_my_project.py",
+    ]
+
+
+def test_create_project_content(config, tmp_path):
+    """Test that generated files are rendered from the configuration."""
+    ProjectGenerator(config).create_project(tmp_path)
+
+    pyproject = (tmp_path / "pyproject.toml").read_text(encoding="utf-8")
+    assert 'name = "my-project"' in pyproject
+    assert 'target-version = "py312"' in pyproject
+    assert '{name = "Jane Doe", email = "jane@example.com"}' in pyproject
+
+    ci = (tmp_path / ".github" / "workflows" / "ci.yml").read_text(encoding="utf-8")
+    assert 'python-version: ["3.12"]' in ci
+    assert "${{ matrix.python-version }}" in ci
+
+    assert (tmp_path / ".python-version").read_text(encoding="utf-8") == "3.12"
+
+
+def test_create_project_overwrites_existing_files(config, tmp_path):
+    """Test that generating into an existing project replaces its files."""
+    (tmp_path / "README.md").write_text("stale content", encoding="utf-8")
+    ProjectGenerator(config).create_project(tmp_path)
+
+    readme = (tmp_path / "README.md").read_text(encoding="utf-8")
+    assert readme.startswith("# my-project")
@@ -0,0 +1,26 @@
+"""Tests for the PyBake project templates."""
+
+import pytest
+
+from pybake.templates import get_project_templates, get_template_config
+
+
+def test_get_template_config():
+    """Test looking up a known template."""
+    template = get_template_config("minimal")
+    assert template["name"] == "Minimal Python Project"
+    assert "pytest for testing" in template["features"]
+
+
+def test_get_template_config_unknown():
+    """Test that unknown templates are rejected."""
+    with pytest.raises(ValueError, match="Unknown template: missing"):
+        get_template_config("missing")
+
+
+def test_templates_are_read_only():
+    """Test that the shared template definitions cannot be mutated."""
+    templates = get_project_templates()
+    assert templates is get_project_templates()
+    with pytest.raises(TypeError):
+        templates["standard"]["name"] = "Changed"  # type: ignore[index]
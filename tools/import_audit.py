@@ -0,0 +1,73 @@
+"""Report slow imports for a PyBake command.
+
+Runs ``python -X importtime -m pybake <args>`` and lists the modules whose
+cumulative import time exceeds a threshold, slowest first.
+
+Usage::
+
+    python tools/import_audit.py                  # audits `pybake info`
+    python tools/import_audit.py --threshold 2 -- list-templates
+"""
+
+import argparse
+import subprocess
+import sys
+
+
+def parse_importtime(output: str) -> list[tuple[str, int, int]]:
+    """Parse ``-X importtime`` output into (module, self_us, cumulative_us).
+
+    Module names are stripped of the indentation that shows nesting, since the
+    report re-sorts them by cumulative time.
+    """
+    results = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        results.append((module.strip(), int(self_us), int(cumulative_us)))
+    return results
+
+
+def main() -> int:
+    """Run the audit and print the slow imports."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=5.0,
+        help="Cumulative import time in ms above which a module is reported",
+    )
+    parser.add_argument(
+        "command", nargs="*", default=["info"], help="pybake command to audit"
+    )
+    args = parser.parse_args()
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "pybake", *args.command],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(f"pybake {' '.join(args.command)} failed:", file=sys.stderr)
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:"):
+                print(line, file=sys.stderr)
+        return result.returncode
+
+    imports = parse_importtime(result.stderr)
+    threshold_us = args.threshold * 1000
+
+    print(f"pybake {' '.join(args.command)}: {len(imports)} modules imported")
+    print(f"{'cumulative ms':>14}  {'self ms':>8}  module")
+    for module, self_us, cumulative_us in sorted(
+        imports, key=lambda item: item[2], reverse=True
+    ):
+        if cumulative_us >= threshold_us:
+            print(f"{cumulative_us / 1000:>14.1f}  {self_us / 1000:>8.1f}  {module}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())